@@ -9,6 +9,7 @@ This example demonstrates how to:
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -36,18 +37,21 @@ from mindzie_api.exceptions import (
 sys.path.append(str(Path(__file__).parent.parent / 'projects'))
 from api_utils import get_client, load_credentials
 
+# ISO 8601 timestamps as returned by the API (e.g. 2024-01-15T10:30:00Z)
+ISO_TIMESTAMP_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T')
+
 
 def format_timestamp(timestamp_str):
     """Format ISO timestamp to readable format."""
     if not timestamp_str:
         return "N/A"
     try:
-        if 'T' in timestamp_str:
+        if ISO_TIMESTAMP_PATTERN.match(timestamp_str):
             dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
         else:
             dt = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
         return dt.strftime("%Y-%m-%d %H:%M")
-    except:
+    except (ValueError, TypeError):
         return str(timestamp_str)[:19] if len(str(timestamp_str)) > 19 else str(timestamp_str)
 
 
@@ -6,22 +6,23 @@ This module provides common functionality used across multiple example scripts
 including credential management, API URL configuration, and error handling.
 """
 
+import atexit
+import hashlib
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
 
-# Add parent directory to path for .env loading
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Try to load .env file if it exists
+# Optional faster JSON decoder for API responses; falls back to requests' decoder
 try:
-    from dotenv import load_dotenv
-    env_file = Path(__file__).parent.parent / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
+    import orjson
 except ImportError:
-    pass
+    orjson = None
 
 # Import the proper mindzie_api library
 from mindzie_api import MindzieAPIClient
@@ -30,26 +31,83 @@ from mindzie_api.exceptions import (
     ValidationError, ServerError, TimeoutError
 )
 
+# API server used when MINDZIE_API_URL is not set
+DEFAULT_BASE_URL = "https://dev.mindziestudio.com"
+
+# Shared examples directory holding common_utils.py and the optional .env file
+EXAMPLES_DIR = Path(__file__).parent.parent
+
+# Optional .env file with credentials, loaded on first credential lookup
+ENV_FILE = EXAMPLES_DIR / '.env'
+
+# Modification time of ENV_FILE when it was last loaded
+_env_file_mtime: Optional[int] = None
+
+def ensure_env_loaded() -> None:
+    """Load the .env file into the environment if it is new or has changed.
+    
+    The file is only parsed again when its modification time changes, and
+    nothing happens if the file or python-dotenv is missing.
+    """
+    global _env_file_mtime
+    try:
+        mtime = ENV_FILE.stat().st_mtime_ns
+    except OSError:
+        return
+    if mtime == _env_file_mtime:
+        return
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(ENV_FILE)
+    _env_file_mtime = mtime
+
+def bootstrap() -> None:
+    """Prepare a project example script to run.
+    
+    Adds the examples directory to sys.path (only if it is missing) so the
+    shared common_utils module can be imported, and loads the .env file
+    through ensure_env_loaded().
+    """
+    examples_dir = str(EXAMPLES_DIR)
+    if examples_dir not in sys.path:
+        sys.path.append(examples_dir)
+    ensure_env_loaded()
+
+@lru_cache(maxsize=1)
 def load_credentials() -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Load and validate API credentials from environment variables.
     
+    Values from the .env file are loaded first (see ensure_env_loaded).
+    The result is cached; call reset_credentials() after changing the
+    environment variables or .env file to pick up the new values.
+    
     Returns:
         tuple: (tenant_id, api_key, base_url) or (None, None, None) if invalid
     """
-    tenant_id = os.getenv("MINDZIE_TENANT_ID")
-    api_key = os.getenv("MINDZIE_API_KEY") 
-    base_url = os.getenv("MINDZIE_API_URL", "https://dev.mindziestudio.com").rstrip("/")
+    ensure_env_loaded()
+    
+    env = os.environ
+    tenant_id = env.get("MINDZIE_TENANT_ID")
+    api_key = env.get("MINDZIE_API_KEY")
+    base_url = env.get("MINDZIE_API_URL", DEFAULT_BASE_URL).rstrip("/")
     
     if not tenant_id or not api_key:
         return None, None, None
     
     return tenant_id, api_key, base_url
 
+def reset_credentials() -> None:
+    """Clear the cached credentials so the next load re-reads the environment."""
+    load_credentials.cache_clear()
+
 def print_credential_error() -> None:
     """Print helpful error message for missing credentials."""
     print("[ERROR] Missing credentials!")
     print("Set MINDZIE_TENANT_ID and MINDZIE_API_KEY environment variables")
-    print("Optionally set MINDZIE_API_URL (defaults to https://dev.mindziestudio.com)")
+    print(f"Optionally set MINDZIE_API_URL (defaults to {DEFAULT_BASE_URL})")
 
 def get_client() -> Optional[MindzieAPIClient]:
     """Get a configured MindzieAPIClient instance.
@@ -63,7 +121,7 @@ def get_client() -> Optional[MindzieAPIClient]:
         return None
     
     try:
-        return MindzieAPIClient(
+        client = MindzieAPIClient(
             base_url=base_url,
             tenant_id=tenant_id,
             api_key=api_key
@@ -71,21 +129,199 @@ def get_client() -> Optional[MindzieAPIClient]:
     except Exception as e:
         print(f"[ERROR] Failed to create API client: {e}")
         return None
+    
+    configure_fast_json(client)
+    return client
 
-def get_all_projects() -> Optional[List[Dict[str, Any]]]:
-    """Get all projects from the API using MindzieAPIClient.
+# Project fields used by format_project_list()
+PROJECT_LIST_FIELDS = ("project_id", "project_name", "dataset_count", "is_active")
+
+def project_fields(project: Any, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Copy selected fields from a project model into a dictionary.
+    
+    Fields the model does not have are left out, matching model_dump().
+    
+    Args:
+        project: Project model returned by the library
+        fields: Field names to copy
     
     Returns:
-        list: List of projects as dictionaries or None on error
+        dict: The selected fields
+    """
+    return {field: getattr(project, field) for field in fields if hasattr(project, field)}
+
+# Results of controller_supports(), keyed by (controller class, method name)
+_capability_cache: Dict[Tuple[type, str], bool] = {}
+
+def controller_supports(controller: Any, method_name: str) -> bool:
+    """Check whether an API controller provides a method.
+    
+    The answer is cached per controller class, so repeated probes (for
+    example in bulk operations) skip the attribute lookup.
+    
+    Args:
+        controller: Controller instance, e.g. client.projects
+        method_name: Name of the method to look for
+    
+    Returns:
+        bool: True if the controller has the method
+    """
+    key = (type(controller), method_name)
+    if key not in _capability_cache:
+        _capability_cache[key] = hasattr(controller, method_name)
+    return _capability_cache[key]
+
+# Client shared by the helpers below; created on first use
+_shared_client: Optional[MindzieAPIClient] = None
+
+# Connections kept open per host by the shared client
+SHARED_POOL_SIZE = 32
+
+def configure_connection_pool(client: MindzieAPIClient, pool_size: int = SHARED_POOL_SIZE) -> bool:
+    """Enlarge the keep-alive connection pool of a client's HTTP session.
+    
+    The default requests pool keeps 10 connections per host, so concurrent
+    calls beyond that open and discard extra sockets. The new adapter keeps
+    the retry policy of the one it replaces: mindzie_api retries 429 and 5xx
+    responses through the adapter, and only retries timeouts and connection
+    errors itself.
+    
+    Args:
+        client: Client whose session should be configured
+        pool_size: Maximum number of pooled connections per host
+    
+    Returns:
+        bool: True if the pool was configured, False if the client does not
+        expose a requests session
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        return False
+    
+    session = getattr(client, "session", None)
+    if not isinstance(session, requests.Session):
+        return False
+    
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                          max_retries=session.get_adapter("https://").max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return True
+
+def _orjson_response_hook(response: Any, *args: Any, **kwargs: Any) -> Any:
+    """Make response.json() decode with orjson (requests response hook)."""
+    default_json = response.json
+    
+    def json_with_orjson(**json_kwargs: Any) -> Any:
+        if not json_kwargs:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # Non-UTF-8 or invalid bodies raise the usual requests error
+                pass
+        return default_json(**json_kwargs)
+    
+    response.json = json_with_orjson
+    return response
+
+def configure_fast_json(client: MindzieAPIClient) -> bool:
+    """Decode the JSON responses of a client with orjson when it is installed.
+    
+    The library parses every response with response.json(); orjson does the
+    same work several times faster, which adds up for large project lists.
+    
+    Args:
+        client: Client whose session should be configured
+    
+    Returns:
+        bool: True if the hook was installed, False if orjson is missing or
+        the client does not expose a requests session
     """
-    client = get_client()
+    if orjson is None:
+        return False
+    try:
+        import requests
+    except ImportError:
+        return False
+    
+    session = getattr(client, "session", None)
+    if not isinstance(session, requests.Session):
+        return False
+    
+    if _orjson_response_hook not in session.hooks['response']:
+        session.hooks['response'].append(_orjson_response_hook)
+    return True
+
+def get_shared_client() -> Optional[MindzieAPIClient]:
+    """Get the MindzieAPIClient shared by the helpers in this module.
+    
+    The client is created on first use and closed automatically when the
+    interpreter exits, so repeated helper calls reuse its open connections
+    instead of reconnecting each time. Do not close it yourself; use
+    get_client() when you need a client you own.
+    
+    Returns:
+        MindzieAPIClient instance or None if credentials are missing
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = get_client()
+        if _shared_client is not None:
+            configure_connection_pool(_shared_client)
+            atexit.register(close_shared_client)
+    return _shared_client
+
+def close_shared_client() -> None:
+    """Close the shared client, if one has been created."""
+    global _shared_client
+    if _shared_client is None:
+        return
+    try:
+        _shared_client.close()
+    except Exception as e:
+        print(f"Warning: Failed to close client connection: {e}", file=sys.stderr)
+    finally:
+        _shared_client = None
+
+@contextmanager
+def api_session() -> Iterator[Optional[MindzieAPIClient]]:
+    """Hold the shared client open for the duration of a script.
+    
+    Helpers called inside the block reuse the same connections, and the
+    client is closed when the block exits instead of at interpreter exit:
+    
+        with api_session() as client:
+            projects = get_all_projects(client=client)
+    
+    Yields:
+        MindzieAPIClient instance or None if credentials are missing
+    """
+    client = get_shared_client()
+    try:
+        yield client
+    finally:
+        close_shared_client()
+
+def get_all_projects_raw(client: Optional[MindzieAPIClient] = None) -> Optional[List[Any]]:
+    """Get all projects from the API as the library's Pydantic models.
+    
+    Use this when only a few projects or fields are needed, and call
+    model_dump() on just the ones you keep.
+    
+    Args:
+        client: Client to use instead of the shared client; it is not closed
+    
+    Returns:
+        list: List of project models or None on error
+    """
+    client = client or get_shared_client()
     if not client:
         return None
     
     try:
-        projects = client.projects.list_projects()
-        # Convert Pydantic models to dictionaries for backward compatibility
-        return [project.model_dump() for project in projects]
+        return client.projects.list_projects()
         
     except AuthenticationError:
         print("[ERROR] Authentication failed - check your credentials")
@@ -96,33 +332,228 @@ def get_all_projects() -> Optional[List[Dict[str, Any]]]:
     except Exception as e:
         print(f"[ERROR] Failed to retrieve projects: {e}")
         return None
-    finally:
-        try:
-            client.close()
-        except Exception as e:
-            # Log the error but don't raise - we already have our result
-            print(f"Warning: Failed to close client connection: {e}", file=sys.stderr)
 
-def get_project_by_id(project_id: str) -> Optional[Dict[str, Any]]:
+def get_all_projects(fields: Optional[Tuple[str, ...]] = None,
+                     client: Optional[MindzieAPIClient] = None) -> Optional[List[Dict[str, Any]]]:
+    """Get all projects from the API using MindzieAPIClient.
+    
+    Args:
+        fields: Optional field names to copy from each project (see
+            project_fields). When given, the full model_dump() is skipped.
+        client: Client to use instead of the shared client; it is not closed
+    
+    Returns:
+        list: List of projects as dictionaries or None on error
+    """
+    projects = get_all_projects_raw(client)
+    if projects is None:
+        return None
+    
+    if fields:
+        return [project_fields(project, fields) for project in projects]
+    # Convert Pydantic models to dictionaries for backward compatibility
+    return [project.model_dump() for project in projects]
+
+# Project lists cached on disk between runs; MINDZIE_CACHE_TTL overrides the TTL
+CACHE_DIR = Path.home() / '.cache' / 'mindzie'
+DEFAULT_CACHE_TTL = 300
+
+# Names of the on-disk caches that hold project lists
+PROJECT_CACHE_NAMES = ("projects", "project_list", "discovered_projects")
+
+# Name of the on-disk cache holding one project summary per file
+SUMMARY_CACHE_NAME = "summary"
+
+def get_cache_ttl() -> float:
+    """Get the on-disk cache TTL in seconds from MINDZIE_CACHE_TTL."""
+    try:
+        return float(os.environ.get('MINDZIE_CACHE_TTL', DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+def get_cache_scope() -> Optional[str]:
+    """Get the cache file name part identifying the current tenant and API URL.
+    
+    Returns:
+        Short hash of the base URL and tenant ID or None if credentials are missing
+    """
+    tenant_id, _, base_url = load_credentials()
+    if not tenant_id:
+        return None
+    scope_source = f"{base_url}|{tenant_id}"
+    return hashlib.sha256(scope_source.encode('utf-8')).hexdigest()[:16]
+
+def get_cache_file(name: str, *key_parts: str) -> Optional[Path]:
+    """Get the cache file called name for the current tenant and API URL.
+    
+    Files are named "<name>_<scope>_<key>.json", so one tenant's entries can
+    be found by prefix without touching other tenants'.
+    
+    Args:
+        name: Cache name, used as the file name prefix
+        *key_parts: Request parameters (e.g. a project ID) that select the entry
+    
+    Returns:
+        Path of the cache file or None if credentials are missing
+    """
+    scope = get_cache_scope()
+    if not scope:
+        return None
+    key = hashlib.sha256("|".join(key_parts).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"{name}_{scope}_{key}.json"
+
+def load_cached(cache_file: Path, ttl: float) -> Optional[Any]:
+    """Load a cached payload if it is younger than ttl seconds.
+    
+    Returns:
+        The cached payload or None if it is missing, stale or unreadable
+    """
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            cached = json.load(f)
+        if time.time() - cached['fetched_at'] < ttl:
+            return cached['payload']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _encode_cache_value(value: Any) -> Any:
+    """Encode a value json cannot: datetimes as ISO 8601 strings, others with str()."""
+    isoformat = getattr(value, 'isoformat', None)
+    return isoformat() if callable(isoformat) else str(value)
+
+def to_cache_payload(payload: Any) -> Any:
+    """Convert a payload to the form it has when read back from the cache.
+    
+    Datetimes become ISO 8601 strings, so callers get the same types whether
+    or not a result came from the cache.
+    """
+    return json.loads(json.dumps(payload, default=_encode_cache_value))
+
+def save_cached(cache_file: Path, payload: Any) -> None:
+    """Write a payload to a cache file; failures only skip caching.
+    
+    Datetimes are stored as ISO 8601 strings (see to_cache_payload()).
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'fetched_at': time.time(), 'payload': payload}, f,
+                      default=_encode_cache_value)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+
+def fetch_cached(cache_name: Optional[str], fetch: Callable[[], Any], *key_parts: str,
+                 refresh: bool = False) -> Any:
+    """Return the result of fetch(), going through the on-disk cache.
+    
+    Results younger than get_cache_ttl() seconds are read from the cache;
+    None results are never cached. Fresh results are passed through
+    to_cache_payload() even when the cache is bypassed, so datetimes are
+    always returned as ISO 8601 strings.
+    
+    Args:
+        cache_name: Cache name (see get_cache_file) or None to bypass the cache
+        fetch: Function making the request
+        *key_parts: Request parameters that select the cache entry
+        refresh: Skip the cached entry but store the fresh result
+    
+    Returns:
+        The cached or freshly fetched result
+    """
+    ttl = get_cache_ttl()
+    cache_file = get_cache_file(cache_name, *key_parts) if cache_name and ttl > 0 else None
+    if cache_file and not refresh:
+        cached = load_cached(cache_file, ttl)
+        if cached is not None:
+            return cached
+    
+    result = fetch()
+    if result is not None:
+        result = to_cache_payload(result)
+        if cache_file:
+            save_cached(cache_file, result)
+    return result
+
+def clear_project_caches(project_id: Optional[str] = None) -> None:
+    """Delete the on-disk project caches for the current tenant.
+    
+    Args:
+        project_id: Also delete this project's cached summary, or None to
+            delete every cached summary of the current tenant
+    """
+    cache_files = [get_cache_file(name) for name in PROJECT_CACHE_NAMES]
+    if project_id is not None:
+        cache_files.append(get_cache_file(SUMMARY_CACHE_NAME, project_id))
+    else:
+        scope = get_cache_scope()
+        if scope:
+            cache_files.extend(CACHE_DIR.glob(f"{SUMMARY_CACHE_NAME}_{scope}_*.json"))
+    
+    for cache_file in cache_files:
+        if cache_file:
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+
+# Seconds a project fetched by get_project_by_id() is reused without refetching
+PROJECT_CACHE_TTL = 60.0
+
+# project_id -> (time fetched, project data)
+_project_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+def invalidate_project(project_id: Optional[str] = None) -> None:
+    """Drop cached project data after the project has been changed.
+    
+    The on-disk project lists are always cleared, since they may still
+    list the changed project, along with the project's cached summary.
+    
+    Args:
+        project_id: Project to forget, or None to clear the whole cache
+    """
+    if project_id is None:
+        _project_cache.clear()
+    else:
+        _project_cache.pop(project_id, None)
+    clear_project_caches(project_id)
+
+def get_project_by_id(project_id: str,
+                      client: Optional[MindzieAPIClient] = None) -> Optional[Dict[str, Any]]:
     """Get a specific project by ID using MindzieAPIClient.
     
+    Successful lookups are cached for PROJECT_CACHE_TTL seconds so repeated
+    requests for the same project within a script skip the round trip.
+    Call invalidate_project() after modifying a project.
+    
     Args:
         project_id: Project ID (GUID format)
+        client: Client to use instead of the shared client; it is not closed
     
     Returns:
         dict: Project data or None on error
     """
-    client = get_client()
+    cached = _project_cache.get(project_id)
+    if cached and time.monotonic() - cached[0] < PROJECT_CACHE_TTL:
+        return dict(cached[1])
+    
+    client = client or get_shared_client()
     if not client:
         return None
     
     try:
         project = client.projects.get_by_id(project_id)
         # Convert Pydantic model to dictionary for backward compatibility
-        return project.model_dump()
+        project_data = project.model_dump()
+        _project_cache[project_id] = (time.monotonic(), project_data)
+        return dict(project_data)
         
     except NotFoundError:
         print(f"[ERROR] Project not found: {project_id}")
+        # A cached project list may still point at it
+        clear_project_caches(project_id)
         return None
     except ValidationError as e:
         print(f"[ERROR] Invalid project ID format: {project_id}")
@@ -133,23 +564,87 @@ def get_project_by_id(project_id: str) -> Optional[Dict[str, Any]]:
     except Exception as e:
         print(f"[ERROR] Failed to retrieve project: {e}")
         return None
-    finally:
+
+# Upper bound on concurrent get_by_id requests made by get_projects_bulk()
+BULK_FETCH_WORKERS = 5
+
+def get_projects_bulk(project_ids: List[str], client: Optional[MindzieAPIClient] = None,
+                      use_list: bool = True) -> Dict[str, Dict[str, Any]]:
+    """Get several projects by ID with as few requests as possible.
+    
+    Uses a bulk endpoint when the library offers one, otherwise a single
+    list_projects() call, and fetches any IDs still missing in parallel
+    with get_project_by_id().
+    
+    Args:
+        project_ids: Project IDs (GUID format) to fetch
+        client: Client to use instead of the shared client; it is not closed
+        use_list: Whether to try list_projects(); pass False when the caller
+            has already looked the IDs up in the project list
+    
+    Returns:
+        dict: Project data keyed by project ID; IDs that could not be
+        fetched are left out (and reported by get_project_by_id())
+    """
+    wanted = list(dict.fromkeys(project_ids))
+    found: Dict[str, Dict[str, Any]] = {}
+    if not wanted:
+        return found
+    
+    client = client or get_shared_client()
+    if not client:
+        return found
+    
+    if controller_supports(client.projects, 'get_bulk'):
         try:
-            client.close()
+            for project in client.projects.get_bulk(ids=wanted):
+                found[project.project_id] = project.model_dump()
         except Exception as e:
-            # Log the error but don't raise - we already have our result
-            print(f"Warning: Failed to close client connection: {e}", file=sys.stderr)
+            print(f"[WARNING] Bulk project lookup failed, falling back: {e}")
+    
+    if use_list and len(found) < len(wanted):
+        projects = get_all_projects_raw(client) or []
+        wanted_set = set(wanted)
+        for project in projects:
+            if project.project_id in wanted_set and project.project_id not in found:
+                found[project.project_id] = project.model_dump()
+    
+    missing = [project_id for project_id in wanted if project_id not in found]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(BULK_FETCH_WORKERS, len(missing))) as executor:
+            fetched = executor.map(lambda project_id: get_project_by_id(project_id, client), missing)
+            for project_id, project in zip(missing, fetched):
+                if project:
+                    found[project_id] = project
+    
+    return found
 
-def get_project_summary_by_id(project_id: str) -> Optional[Dict[str, Any]]:
+def get_project_summary_by_id(project_id: str,
+                              client: Optional[MindzieAPIClient] = None,
+                              use_cache: bool = True,
+                              refresh: bool = False) -> Optional[Dict[str, Any]]:
     """Get project summary by ID using MindzieAPIClient.
     
+    Summaries are cached on disk for get_cache_ttl() seconds, so repeated
+    runs within a work session skip the request.
+    
     Args:
         project_id: Project ID (GUID format)
+        client: Client to use instead of the shared client; it is not closed
+        use_cache: Whether to use the on-disk cache
+        refresh: Fetch the summary even if it is cached, and cache the result
     
     Returns:
         dict: Project summary data or None on error
     """
-    client = get_client()
+    cache_name = SUMMARY_CACHE_NAME if use_cache else None
+    return fetch_cached(cache_name, lambda: _fetch_project_summary(project_id, client),
+                        project_id, refresh=refresh)
+
+def _fetch_project_summary(project_id: str,
+                           client: Optional[MindzieAPIClient] = None) -> Optional[Dict[str, Any]]:
+    """Request a project summary from the API; see get_project_summary_by_id()."""
+    client = client or get_shared_client()
     if not client:
         return None
     
@@ -170,22 +665,61 @@ def get_project_summary_by_id(project_id: str) -> Optional[Dict[str, Any]]:
     except Exception as e:
         print(f"[ERROR] Failed to retrieve project summary: {e}")
         return None
-    finally:
-        try:
-            client.close()
-        except Exception as e:
-            # Log the error but don't raise - we already have our result
-            print(f"Warning: Failed to close client connection: {e}", file=sys.stderr)
 
-def discover_projects(needed_count: int = 1, message_prefix: str = "project") -> Optional[List[Dict[str, Any]]]:
+# Upper bound on concurrent get_summary requests made by get_project_summaries()
+SUMMARY_FETCH_WORKERS = 16
+
+def get_project_summaries(project_ids: List[str],
+                          client: Optional[MindzieAPIClient] = None,
+                          use_cache: bool = True,
+                          refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Get the summaries of several projects concurrently.
+    
+    The requests share one client and its connection pool, so the wait is
+    roughly len(project_ids) / SUMMARY_FETCH_WORKERS round trips instead
+    of one per project.
+    
+    Args:
+        project_ids: Project IDs (GUID format)
+        client: Client to use instead of the shared client; it is not closed
+        use_cache: Whether to use the on-disk cache
+        refresh: Fetch every summary even if it is cached
+    
+    Returns:
+        dict: Summary data by project ID; projects whose summary could not
+        be retrieved are left out
+    """
+    if not project_ids:
+        return {}
+    client = client or get_shared_client()
+    if not client:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(SUMMARY_FETCH_WORKERS, len(project_ids))) as executor:
+        summaries = executor.map(
+            lambda project_id: get_project_summary_by_id(project_id, client, use_cache, refresh),
+            project_ids
+        )
+        return {project_id: summary for project_id, summary in zip(project_ids, summaries) if summary}
+
+def discover_projects(needed_count: int = 1, message_prefix: str = "project",
+                      use_cache: bool = True,
+                      client: Optional[MindzieAPIClient] = None) -> Optional[List[Dict[str, Any]]]:
     """Smart project discovery with user-friendly messages using MindzieAPIClient.
     
+    The selected projects are cached on disk for get_cache_ttl() seconds,
+    so repeated runs skip the project list request.
+    
     Args:
         needed_count: Number of projects needed
         message_prefix: Descriptive term for what we're finding
+        use_cache: Whether to use the on-disk cache
+        client: Client to use instead of the shared client; it is not closed
     
     Returns:
-        list: Selected projects as dictionaries or None if insufficient projects available
+        list: Selected projects as dictionaries or None if insufficient projects available.
+        Only the selected projects are converted from the Pydantic models, so
+        callers do not need a follow-up get_project_by_id() for names or IDs.
     """
     # Show discovery message
     if needed_count == 1:
@@ -193,23 +727,31 @@ def discover_projects(needed_count: int = 1, message_prefix: str = "project") ->
     else:
         print(f"[INFO] Finding {needed_count} {message_prefix}s for comparison, please wait...")
     
-    projects = get_all_projects()
-    if not projects:
-        print("[ERROR] No projects found.")
-        print("        Create a project in mindzieStudio first.")
-        print("        Visit https://dev.mindziestudio.com to create a project.")
-        return None
-    
-    if len(projects) < needed_count:
-        if len(projects) == 1 and needed_count > 1:
-            print(f"[WARNING] Only 1 project found, need {needed_count} for comparison.")
-            print("          Create more projects in mindzieStudio to enable comparison.")
-        else:
-            print(f"[WARNING] Only {len(projects)} project(s) found, need {needed_count}")
-        return projects[:needed_count]  # Return what we have
-    
-    # Select projects (first N for consistency)
-    selected = projects[:needed_count]
+    ttl = get_cache_ttl()
+    cache_file = get_cache_file("discovered_projects") if use_cache and ttl > 0 else None
+    cached = load_cached(cache_file, ttl) if cache_file else None
+    if isinstance(cached, list) and len(cached) >= needed_count:
+        selected = cached[:needed_count]
+    else:
+        projects = get_all_projects_raw(client)
+        if not projects:
+            print("[ERROR] No projects found.")
+            print("        Create a project in mindzieStudio first.")
+            print("        Visit https://dev.mindziestudio.com to create a project.")
+            return None
+    
+        if len(projects) < needed_count:
+            if len(projects) == 1 and needed_count > 1:
+                print(f"[WARNING] Only 1 project found, need {needed_count} for comparison.")
+                print("          Create more projects in mindzieStudio to enable comparison.")
+            else:
+                print(f"[WARNING] Only {len(projects)} project(s) found, need {needed_count}")
+            return to_cache_payload([p.model_dump() for p in projects])  # Return what we have
+    
+        # Select projects (first N for consistency)
+        selected = to_cache_payload([p.model_dump() for p in projects[:needed_count]])
+        if cache_file:
+            save_cached(cache_file, selected)
     
     # Show what we picked
     if needed_count == 1:
@@ -219,11 +761,8 @@ def discover_projects(needed_count: int = 1, message_prefix: str = "project") ->
         print(f"[SUCCESS] Using project: '{project_name}' (auto-selected)")
         print(f"          ID: {project_id}")
     else:
-        names = []
-        for p in selected:
-            name = p.get('project_name', 'Unknown')
-            names.append(f"'{name}'")
-        print(f"[SUCCESS] Using projects: {', '.join(names)} (auto-selected)")
+        names = ', '.join(f"'{p.get('project_name', 'Unknown')}'" for p in selected)
+        print(f"[SUCCESS] Using projects: {names} (auto-selected)")
     
     return selected
 
@@ -238,14 +777,15 @@ def get_random_projects(count: int = 2) -> Optional[List[Dict[str, Any]]]:
     """
     import random
     
-    projects = get_all_projects()
+    projects = get_all_projects_raw()
     if not projects:
         return None
     
-    if len(projects) <= count:
-        return projects
+    # Sample the models first so only the chosen projects are converted
+    if len(projects) > count:
+        projects = random.sample(projects, count)
     
-    return random.sample(projects, count)
+    return [project.model_dump() for project in projects]
 
 def show_usage_tip(script_name: str, example_id: Optional[str] = None) -> None:
     """Show helpful tip about customizing the script.
@@ -288,60 +828,65 @@ def format_project_list(projects: List[Dict[str, Any]], max_display: int = 10) -
     
     return "\n".join(output)
 
+# Fixed description printed by main() before the live test
+MAIN_BANNER = "\n".join([
+    "=" * 60,
+    "mindzie API Utilities (api_utils.py)",
+    "=" * 60,
+    "",
+    "This file provides shared utility functions for mindzie API examples.",
+    "It's meant to be imported by other scripts, not run directly.",
+    "",
+    "Functions provided:",
+    "  - get_client() - Get configured MindzieAPIClient instance",
+    "  - get_shared_client() - Get the client reused by the helpers below",
+    "  - api_session() - Keep the shared client open for a whole script",
+    "  - load_credentials() - Load API credentials from environment",
+    "  - bootstrap() - Set up sys.path and .env for a project example script",
+    "  - get_all_projects() - Fetch all projects using proper API client",
+    "  - get_project_by_id() - Fetch specific project details with type safety",
+    "  - get_projects_bulk() - Fetch several projects with as few requests as possible",
+    "  - get_project_summary_by_id() - Fetch project summary statistics",
+    "  - discover_projects() - Smart project auto-selection",
+    "  - show_usage_tip() - Display helpful usage tips",
+    "",
+    "Uses the official mindzie_api Python library!",
+    "  - Type-safe operations with Pydantic models",
+    "  - Automatic retries and error handling",
+    "  - Built-in authentication and connection management",
+    "",
+    "Library Status:",
+    "  - All models fixed to match API response format",
+    "  - No known validation issues",
+    "",
+    "Quick test:",
+])
+
 def main() -> int:
     """Main function to explain what api_utils.py does when run directly."""
-    print("=" * 60)
-    print("mindzie API Utilities (api_utils.py)")
-    print("=" * 60)
-    print()
-    print("This file provides shared utility functions for mindzie API examples.")
-    print("It's meant to be imported by other scripts, not run directly.")
-    print()
-    print("Functions provided:")
-    print("  - get_client() - Get configured MindzieAPIClient instance")
-    print("  - load_credentials() - Load API credentials from environment")
-    print("  - get_all_projects() - Fetch all projects using proper API client")
-    print("  - get_project_by_id() - Fetch specific project details with type safety")
-    print("  - get_project_summary_by_id() - Fetch project summary statistics")
-    print("  - discover_projects() - Smart project auto-selection")
-    print("  - show_usage_tip() - Display helpful usage tips")
-    print()
-    print("Uses the official mindzie_api Python library!")
-    print("  - Type-safe operations with Pydantic models")
-    print("  - Automatic retries and error handling")
-    print("  - Built-in authentication and connection management")
-    print()
-    print("Library Status:")
-    print("  - All models fixed to match API response format")
-    print("  - No known validation issues")
-    print()
-    print("Quick test:")
+    sys.stdout.write(MAIN_BANNER + "\n")
     
-    # Test client creation
-    client = get_client()
-    if not client:
-        return 1
-    
-    tenant_id, api_key, base_url = load_credentials()
-    print("[SUCCESS] MindzieAPIClient created successfully")
-    print(f"   Tenant: {tenant_id}")
-    print(f"   API URL: {base_url}")
-    
-    # Test project access
-    print()
-    print("[INFO] Testing project access with mindzie_api library...")
-    
-    try:
-        projects = client.projects.list_projects()
-        print(f"[SUCCESS] Found {len(projects)} project(s) using mindzie_api library")
+    # Test client creation; one session covers the whole test
+    with api_session() as client:
+        if not client:
+            return 1
+        
+        tenant_id, api_key, base_url = load_credentials()
+        print("[SUCCESS] MindzieAPIClient created successfully")
+        print(f"   Tenant: {tenant_id}")
+        print(f"   API URL: {base_url}")
+        
+        # Test project access
         print()
-        print("Available projects:")
-        project_dicts = [p.model_dump() for p in projects[:5]]
-        print(format_project_list(project_dicts, 5))
-    except Exception as e:
-        print(f"[ERROR] Failed to access projects: {e}")
-    finally:
-        client.close()
+        print("[INFO] Testing project access with mindzie_api library...")
+        
+        projects = get_all_projects_raw(client)
+        if projects is not None:
+            print(f"[SUCCESS] Found {len(projects)} project(s) using mindzie_api library")
+            print()
+            print("Available projects:")
+            project_dicts = [project_fields(p, PROJECT_LIST_FIELDS) for p in projects[:5]]
+            print(format_project_list(project_dicts, 5))
     
     print()
     print("[TIP] To use these utilities in your scripts:")
@@ -352,5 +897,4 @@ def main() -> int:
     return 0
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
\ No newline at end of file
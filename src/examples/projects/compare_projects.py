@@ -21,90 +21,121 @@ Examples:
     python compare_projects.py --by-name "AI Studio" "Insurance Claims" "Python Demo"
 """
 
-import os
 import sys
-import argparse
+import re
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 
-# Add parent directory to path for .env loading
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Try to load .env file if it exists
-try:
-    from dotenv import load_dotenv
-    env_file = Path(__file__).parent.parent / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
-except ImportError:
-    pass
-
 # Import the mindzie API library
 from mindzie_api import MindzieAPIClient
 from mindzie_api.exceptions import (
-    MindzieAPIException, AuthenticationError, NotFoundError, TimeoutError
+    MindzieAPIException, AuthenticationError, TimeoutError
 )
 
 # Import our utility functions
-from api_utils import get_client, discover_projects, show_usage_tip
+from api_utils import (
+    bootstrap, get_client, discover_projects, get_projects_bulk, project_fields, show_usage_tip,
+    get_cache_ttl, get_cache_file, load_cached, save_cached, to_cache_payload
+)
+
+# Project fields read by extract_project_data()
+COMPARE_FIELDS = (
+    "project_id", "project_name", "project_description", "is_active",
+    "dataset_count", "dashboard_count", "investigation_count", "user_count",
+    "date_created", "date_modified"
+)
 
+# Defaults for fields a project lacks, in the order extract_project_data() reads them
+PROJECT_DATA_DEFAULTS = {
+    'project_name': 'Unnamed',
+    'project_id': 'N/A',
+    'project_description': '',
+    'is_active': True,
+    'dataset_count': 0,
+    'dashboard_count': 0,
+    'investigation_count': 0,
+    'user_count': 0,
+    'date_created': None,
+    'date_modified': None
+}
+get_project_values = itemgetter(*PROJECT_DATA_DEFAULTS)
+
+# Project IDs are GUIDs; anything else given with --by-name is treated as a name
+GUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE
+)
+
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11 on
+FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+@lru_cache(maxsize=256)
 def format_date(date_str):
-    """Format ISO date string to readable format."""
+    """Format ISO date string (or datetime) to readable format."""
     if not date_str:
         return "N/A"
+    if isinstance(date_str, datetime):
+        return date_str.strftime("%Y-%m-%d %H:%M")
     try:
         if 'T' in date_str:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            if date_str.endswith('Z') and not FROMISOFORMAT_ACCEPTS_Z:
+                date_str = date_str[:-1] + '+00:00'
+            dt = datetime.fromisoformat(date_str)
         else:
             dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
         return dt.strftime("%Y-%m-%d %H:%M")
-    except:
+    except (ValueError, TypeError):
         return str(date_str)[:16] if len(str(date_str)) > 16 else str(date_str)
 
-def get_all_projects():
-    """Get all projects using the mindzie library."""
-    client = get_client()
-    if not client:
-        return None
+def get_all_projects(client, use_cache=True):
+    """Get all projects using the mindzie library and an open client.
+    
+    The list is cached on disk for get_cache_ttl() seconds so repeated runs
+    skip the request; pass use_cache=False to always fetch it.
+    """
+    ttl = get_cache_ttl()
+    cache_file = get_cache_file("projects") if use_cache and ttl > 0 else None
+    if cache_file:
+        cached = load_cached(cache_file, ttl)
+        if cached is not None:
+            return cached
     
     try:
         projects = client.projects.list_projects()
-        # Convert to dict format for backward compatibility with rest of the script
-        return [project.model_dump() for project in projects]
+        # Copy only the compared fields instead of a full model_dump()
+        project_dicts = to_cache_payload([project_fields(project, COMPARE_FIELDS) for project in projects])
     except Exception as e:
         print(f"[ERROR] Failed to retrieve projects: {e}")
         return None
-    finally:
-        client.close()
-
-def get_project_by_id(project_id):
-    """Get a specific project by ID using the mindzie library."""
-    client = get_client()
-    if not client:
-        return None
     
-    try:
-        project = client.projects.get_by_id(project_id)
-        return project.model_dump()
-    except NotFoundError:
-        print(f"[ERROR] Project '{project_id}' not found")
-        return None
-    except Exception as e:
-        print(f"[ERROR] Failed to retrieve project {project_id}: {e}")
-        return None
-    finally:
-        client.close()
+    if cache_file:
+        save_cached(cache_file, project_dicts)
+    return project_dicts
 
-def find_project_by_name(name, all_projects):
-    """Find a project by name (case-insensitive partial match)."""
+def build_name_index(all_projects):
+    """Lower-case every project name once for repeated name lookups.
+    
+    Returns a list of (lower_name, project) pairs and a dict of names that
+    belong to exactly one project.
+    """
+    indexed = [((p.get('project_name') or '').lower(), p) for p in all_projects]
+    exact = {}
+    for name_lower, project in indexed:
+        # A name shared by several projects stays ambiguous
+        exact[name_lower] = None if name_lower in exact else project
+    return indexed, exact
+
+def find_project_by_name(name, name_index):
+    """Find a project by name (case-insensitive exact, then partial match)."""
+    indexed, exact = name_index
     name_lower = name.lower()
-    matches = []
     
-    for project in all_projects:
-        project_name = project.get('project_name', '').lower()
-        
-        if name_lower in project_name:
-            matches.append(project)
+    project = exact.get(name_lower)
+    if project:
+        return project
+    
+    matches = [project for project_name, project in indexed if name_lower in project_name]
     
     if len(matches) == 1:
         return matches[0]
@@ -126,44 +157,57 @@ def extract_project_data(project):
     if not project:
         return None
     
+    # Read every field in one call; present keys override the defaults
+    (name, project_id, description, is_active, dataset_count, dashboard_count,
+     investigation_count, user_count, date_created, date_modified) = get_project_values(
+        {**PROJECT_DATA_DEFAULTS, **project}
+    )
+    
     return {
-        'name': project.get('project_name', 'Unnamed'),
-        'id': project.get('project_id', 'N/A'),
-        'description': project.get('project_description', ''),
-        'is_active': project.get('is_active', True),
-        'status': 'Active' if project.get('is_active', True) else 'Inactive',
+        'name': name,
+        'id': project_id,
+        'description': description,
+        'is_active': is_active,
+        'status': 'Active' if is_active else 'Inactive',
         'project_type': 'Standard',  # Default since this field isn't in the current API
-        'dataset_count': project.get('dataset_count', 0),
-        'dashboard_count': project.get('dashboard_count', 0),
-        'notebook_count': project.get('investigation_count', 0),  # Map investigation to notebook for display
-        'user_count': project.get('user_count', 0),
-        'created_date': format_date(project.get('date_created')),
-        'updated_date': format_date(project.get('date_modified'))
+        'dataset_count': dataset_count,
+        'dashboard_count': dashboard_count,
+        'notebook_count': investigation_count,  # Map investigation to notebook for display
+        'user_count': user_count,
+        'created_date': format_date(date_created),
+        'updated_date': format_date(date_modified)
     }
 
-def display_comparison(projects_data):
-    """Display projects in a comparison table."""
+def display_comparison(projects_data, out=None):
+    """Display projects in a comparison table.
+    
+    The report is collected and written to out (default sys.stdout) in a
+    single write.
+    """
     if not projects_data or len(projects_data) < 2:
         print("[ERROR] Need at least 2 projects to compare")
         return
     
+    lines = []
+    
     # Calculate column width based on project names
     max_name_length = max(len(p['name']) for p in projects_data)
     col_width = max(20, min(max_name_length + 2, 25))  # Between 20-25 chars
+    table_width = 25 + col_width * len(projects_data)
     
-    print("=" * (25 + col_width * len(projects_data)))
-    print("PROJECT COMPARISON")
-    print("=" * (25 + col_width * len(projects_data)))
+    lines.append("=" * table_width)
+    lines.append("PROJECT COMPARISON")
+    lines.append("=" * table_width)
     
-    # Header row with project names
-    header = f"{'Metric':<23}"
-    for p in projects_data:
-        name = p['name']
-        if len(name) > col_width - 2:
-            name = name[:col_width-5] + "..."
-        header += f" | {name:<{col_width-2}}"
-    print(header)
-    print("-" * (25 + col_width * len(projects_data)))
+    # Header row with project names, truncated once to fit the columns
+    names = [
+        p['name'][:col_width-5] + "..." if len(p['name']) > col_width - 2 else p['name']
+        for p in projects_data
+    ]
+    # Cells are padded with str.ljust rather than a format spec
+    cell_width = col_width - 2
+    lines.append("Metric".ljust(23) + "".join(" | " + name.ljust(cell_width) for name in names))
+    lines.append("-" * table_width)
     
     # Comparison rows
     rows = [
@@ -180,7 +224,7 @@ def display_comparison(projects_data):
     ]
     
     for label, field in rows:
-        row = f"{label:<23}"
+        row = [label.ljust(23)]
         for p in projects_data:
             if callable(field):
                 value = field(p)
@@ -196,64 +240,72 @@ def display_comparison(projects_data):
                 else:
                     value_str = value_str[:col_width-5] + "..."
             
-            row += f" | {value_str:<{col_width-2}}"
-        print(row)
+            row.append(" | " + value_str.ljust(cell_width))
+        lines.append("".join(row))
     
     # Add descriptions if any project has one
     descriptions = [p['description'] for p in projects_data if p['description']]
     if descriptions:
-        print("\n" + "=" * (25 + col_width * len(projects_data)))
-        print("DESCRIPTIONS")
-        print("=" * (25 + col_width * len(projects_data)))
+        lines.append("\n" + "=" * table_width)
+        lines.append("DESCRIPTIONS")
+        lines.append("=" * table_width)
         
         for i, p in enumerate(projects_data, 1):
             if p['description']:
-                print(f"\n{i}. {p['name']}")
-                print(f"   {p['description']}")
+                lines.append(f"\n{i}. {p['name']}")
+                lines.append(f"   {p['description']}")
     
     # Analysis
-    print("\n" + "=" * (25 + col_width * len(projects_data)))
-    print("COMPARISON ANALYSIS")
-    print("=" * (25 + col_width * len(projects_data)))
-    
-    # Find project with most content
-    most_datasets = max(projects_data, key=lambda p: p['dataset_count'])
-    most_dashboards = max(projects_data, key=lambda p: p['dashboard_count'])
-    most_notebooks = max(projects_data, key=lambda p: p['notebook_count'])
-    most_users = max(projects_data, key=lambda p: p['user_count'])
-    
-    print(f"\nMost Datasets:    {most_datasets['name']} ({most_datasets['dataset_count']} datasets)")
-    print(f"Most Dashboards:  {most_dashboards['name']} ({most_dashboards['dashboard_count']} dashboards)")
-    print(f"Most Notebooks:   {most_notebooks['name']} ({most_notebooks['notebook_count']} notebooks)")
-    print(f"Most Users:       {most_users['name']} ({most_users['user_count']} users)")
+    lines.append("\n" + "=" * table_width)
+    lines.append("COMPARISON ANALYSIS")
+    lines.append("=" * table_width)
+    
+    # Find project with most content and the combined totals in one pass
+    count_fields = ('dataset_count', 'dashboard_count', 'notebook_count', 'user_count')
+    totals = dict.fromkeys(count_fields, 0)
+    best = dict.fromkeys(count_fields, projects_data[0])
+    for p in projects_data:
+        for field in count_fields:
+            totals[field] += p[field]
+            if p[field] > best[field][field]:
+                best[field] = p
+    most_datasets = best['dataset_count']
+    most_dashboards = best['dashboard_count']
+    most_notebooks = best['notebook_count']
+    most_users = best['user_count']
+    
+    lines.append(f"\nMost Datasets:    {most_datasets['name']} ({most_datasets['dataset_count']} datasets)")
+    lines.append(f"Most Dashboards:  {most_dashboards['name']} ({most_dashboards['dashboard_count']} dashboards)")
+    lines.append(f"Most Notebooks:   {most_notebooks['name']} ({most_notebooks['notebook_count']} notebooks)")
+    lines.append(f"Most Users:       {most_users['name']} ({most_users['user_count']} users)")
     
     # Activity analysis
     active_projects = [p for p in projects_data if p['is_active']]
     if len(active_projects) < len(projects_data):
         inactive_count = len(projects_data) - len(active_projects)
-        print(f"\nActivity: {len(active_projects)}/{len(projects_data)} projects are active")
+        lines.append(f"\nActivity: {len(active_projects)}/{len(projects_data)} projects are active")
         if inactive_count > 0:
             inactive_names = [p['name'] for p in projects_data if not p['is_active']]
-            print(f"Inactive: {', '.join(inactive_names)}")
+            lines.append(f"Inactive: {', '.join(inactive_names)}")
     else:
-        print(f"\nActivity: All {len(projects_data)} projects are active")
+        lines.append(f"\nActivity: All {len(projects_data)} projects are active")
     
     # Total content summary
-    total_datasets = sum(p['dataset_count'] for p in projects_data)
-    total_dashboards = sum(p['dashboard_count'] for p in projects_data)
-    total_notebooks = sum(p['notebook_count'] for p in projects_data)
-    total_users = sum(p['user_count'] for p in projects_data)
-    
-    print(f"\nCombined Totals:")
-    print(f"  Datasets: {total_datasets}")
-    print(f"  Dashboards: {total_dashboards}")
-    print(f"  Notebooks: {total_notebooks}")
-    print(f"  Users: {total_users}")
-    
-    print("\n" + "=" * (25 + col_width * len(projects_data)))
+    lines.append(f"\nCombined Totals:")
+    lines.append(f"  Datasets: {totals['dataset_count']}")
+    lines.append(f"  Dashboards: {totals['dashboard_count']}")
+    lines.append(f"  Notebooks: {totals['notebook_count']}")
+    lines.append(f"  Users: {totals['user_count']}")
+    
+    lines.append("\n" + "=" * table_width)
+    
+    (out or sys.stdout).write("\n".join(lines) + "\n")
 
 def main():
     """Main function."""
+    bootstrap()
+    
+    import argparse
     parser = argparse.ArgumentParser(
         description="Compare multiple mindzie projects side by side",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -284,92 +336,113 @@ Examples:
     parser.add_argument('--by-id', nargs='+',
                        help='Additional project IDs when using --by-name')
     
-    args = parser.parse_args()
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Fetch the project list instead of using the local cache')
     
-    # Determine which projects to compare
-    if args.project_ids:
-        project_identifiers = args.project_ids
-        by_name = False
-    elif args.by_name:
-        project_identifiers = args.by_name or []
-        if args.by_id:
-            project_identifiers.extend(args.by_id)
-        by_name = True
-    else:
-        # Auto-discover projects for comparison
-        projects = discover_projects(3, "project")
-        if not projects:
-            return 1
-        
-        # Use first 2-3 projects depending on availability
-        num_projects = min(len(projects), 3)
-        project_identifiers = []
-        for i in range(num_projects):
-            project_id = projects[i].get('project_id')
-            if project_id:
-                project_identifiers.append(project_id)
-        
-        by_name = False
-        show_usage_tip(Path(__file__).name + " --project-ids", "<id1> <id2>")
+    args = parser.parse_args()
     
-    # Validate number of projects
-    if len(project_identifiers) < 2:
-        print("[ERROR] Need at least 2 projects to compare")
-        if not args.project_ids and not args.by_name:
-            print("[INFO] Create more projects in mindzieStudio to enable comparison")
-        return 1
-    elif len(project_identifiers) > 5:
-        print("[ERROR] Can compare at most 5 projects")
+    # One client serves the discovery and every lookup below
+    client = get_client()
+    if not client:
         return 1
     
-    print(f"Comparing {len(project_identifiers)} projects...")
-    print("-" * 60)
-    
-    projects_data = []
-    
-    if by_name:
-        # Get all projects first for name lookup
-        all_projects = get_all_projects()
-        if not all_projects:
+    try:
+        # Determine which projects to compare
+        if args.project_ids:
+            project_identifiers = args.project_ids
+            by_name = False
+        elif args.by_name:
+            project_identifiers = args.by_name or []
+            if args.by_id:
+                project_identifiers.extend(args.by_id)
+            by_name = True
+        else:
+            # Auto-discover projects for comparison
+            projects = discover_projects(3, "project", use_cache=not args.no_cache,
+                                         client=client)
+            if not projects:
+                return 1
+        
+            # Use first 2-3 projects depending on availability
+            num_projects = min(len(projects), 3)
+            project_identifiers = []
+            for i in range(num_projects):
+                project_id = projects[i].get('project_id')
+                if project_id:
+                    project_identifiers.append(project_id)
+        
+            by_name = False
+            show_usage_tip(Path(__file__).name + " --project-ids", "<id1> <id2>")
+        
+        # Validate number of projects
+        if len(project_identifiers) < 2:
+            print("[ERROR] Need at least 2 projects to compare")
+            if not args.project_ids and not args.by_name:
+                print("[INFO] Create more projects in mindzieStudio to enable comparison")
+            return 1
+        elif len(project_identifiers) > 5:
+            print("[ERROR] Can compare at most 5 projects")
             return 1
         
-        for identifier in project_identifiers:
-            if len(identifier) == 36 and identifier.count('-') == 4:
-                # Looks like a GUID, treat as ID
-                project = get_project_by_id(identifier)
-            else:
-                # Treat as name
-                project = find_project_by_name(identifier, all_projects)
+        print(f"Comparing {len(project_identifiers)} projects...")
+        print("-" * 60)
+        
+        projects_data = []
+        
+        if by_name:
+            # Names are resolved from the project list; GUIDs missing from it
+            # are fetched together
+            all_projects = get_all_projects(client, use_cache=not args.no_cache)
+            if not all_projects:
+                return 1
+            projects_by_id = {p.get('project_id'): p for p in all_projects}
+            
+            guids = [i for i in project_identifiers
+                     if GUID_PATTERN.match(i) and i not in projects_by_id]
+            projects_by_id.update(get_projects_bulk(guids, client, use_list=False))
+            name_index = build_name_index(all_projects)
             
-            if project:
-                data = extract_project_data(project)
-                if data:
-                    projects_data.append(data)
-                    print(f"[SUCCESS] Found project: {data['name']}")
+            for identifier in project_identifiers:
+                if GUID_PATTERN.match(identifier):
+                    # Looks like a GUID, treat as ID
+                    project = projects_by_id.get(identifier)
                 else:
-                    print(f"[ERROR] Failed to extract data for project: {identifier}")
+                    # Treat as name
+                    project = find_project_by_name(identifier, name_index)
+                
+                if project:
+                    data = extract_project_data(project)
+                    if data:
+                        projects_data.append(data)
+                        print(f"[SUCCESS] Found project: {data['name']}")
+                    else:
+                        print(f"[ERROR] Failed to extract data for project: {identifier}")
+                        return 1
+                else:
+                    print(f"[ERROR] Could not find project: {identifier}")
                     return 1
-            else:
-                print(f"[ERROR] Could not find project: {identifier}")
-                return 1
-    else:
-        # Get projects by ID
-        for project_id in project_identifiers:
-            if len(project_id) != 36 or project_id.count('-') != 4:
-                print(f"[ERROR] Invalid project ID format: {project_id}")
-                return 1
+        else:
+            # Get projects by ID
+            for project_id in project_identifiers:
+                if not GUID_PATTERN.match(project_id):
+                    print(f"[ERROR] Invalid project ID format: {project_id}")
+                    return 1
+            projects_by_id = get_projects_bulk(project_identifiers, client)
             
-            project = get_project_by_id(project_id)
-            if project:
-                data = extract_project_data(project)
-                if data:
-                    projects_data.append(data)
-                    print(f"[SUCCESS] Found project: {data['name']}")
+            for project_id in project_identifiers:
+                project = projects_by_id.get(project_id)
+                if project:
+                    data = extract_project_data(project)
+                    if data:
+                        projects_data.append(data)
+                        print(f"[SUCCESS] Found project: {data['name']}")
+                    else:
+                        print(f"[ERROR] Failed to extract data for project: {project_id}")
+                        return 1
                 else:
-                    print(f"[ERROR] Failed to extract data for project: {project_id}")
                     return 1
-            else:
-                return 1
+    finally:
+        client.close()
     
     if len(projects_data) < 2:
         print(f"[ERROR] Only found {len(projects_data)} valid project(s), need at least 2")
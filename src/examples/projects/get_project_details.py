@@ -22,8 +22,10 @@ Examples:
 """
 
 import os
+import re
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -34,38 +36,48 @@ from mindzie_api.exceptions import (
     ValidationError, TimeoutError
 )
 
-# Add parent directory to path for .env loading
-sys.path.append(str(Path(__file__).parent.parent))
+# Import our utility functions
+from api_utils import bootstrap, get_project_by_id, discover_projects, show_usage_tip
 
-# Try to load .env file if it exists
-try:
-    from dotenv import load_dotenv
-    env_file = Path(__file__).parent.parent / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
-except ImportError:
-    pass
+# Project IDs are GUIDs (8-4-4-4-12 hex digits)
+GUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE
+)
 
-# Import our utility functions
-from api_utils import get_project_by_id, discover_projects, show_usage_tip
+# Fields shown in their own sections or not worth displaying
+EXCLUDED_KEYS = frozenset({
+    'project_name', 'project_id', 'project_description',
+    'date_created', 'date_modified', 'dataset_count',
+    'investigation_count', 'dashboard_count', 'user_count',
+    'is_active', 'tenant_id', 'created_by', 'modified_by'
+})
 
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11 on
+FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+@lru_cache(maxsize=1024)
 def format_date(date_str):
     """Format ISO date string to readable format."""
     if not date_str:
         return "N/A"
     try:
         if 'T' in date_str:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            if date_str.endswith('Z') and not FROMISOFORMAT_ACCEPTS_Z:
+                date_str = date_str[:-1] + '+00:00'
+            dt = datetime.fromisoformat(date_str)
         else:
             dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
         return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-    except:
+    except (ValueError, TypeError):
         return str(date_str)
 
-def get_project_details(project_id):
-    """Get detailed project information by ID using MindzieAPIClient."""
-    # Use the utility function which handles the API client properly
-    return get_project_by_id(project_id)
+def get_project_details(project_id, client=None):
+    """Get detailed project information by ID using MindzieAPIClient.
+    
+    Without a client, the shared client from api_utils is used, so looking
+    up several projects reuses one connection pool.
+    """
+    return get_project_by_id(project_id, client)
 
 def display_project_details(project_data):
     """Display formatted project details."""
@@ -131,19 +143,18 @@ def display_project_details(project_data):
     print("-" * 40)
     
     for key, value in project_data.items():
-        if key not in ['project_name', 'project_id', 'project_description', 
-                      'date_created', 'date_modified', 'dataset_count', 
-                      'investigation_count', 'dashboard_count', 'user_count',
-                      'is_active', 'tenant_id', 'created_by', 'modified_by']:
-            if value is not None and value != "":
-                # Format the key nicely
-                formatted_key = key.replace('_', ' ').title()
-                print(f"{formatted_key:<18} {value}")
+        if key in EXCLUDED_KEYS or value is None or value == "":
+            continue
+        # Format the key nicely
+        formatted_key = key.replace('_', ' ').title()
+        print(f"{formatted_key:<18} {value}")
     
     print("\n" + "=" * 80)
 
 def main():
     """Main function."""
+    bootstrap()
+    
     parser = argparse.ArgumentParser(
         description="Get detailed information for a specific project",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -168,8 +179,8 @@ Examples:
         # Use provided project ID
         project_id = args.project_id
         
-        # Validate project ID format (basic GUID check)
-        if len(project_id) != 36 or project_id.count('-') != 4:
+        # Validate project ID format
+        if not GUID_PATTERN.match(project_id):
             print(f"[ERROR] Invalid project ID format: {project_id}")
             print("Project ID should be in GUID format (e.g., 12345678-1234-1234-1234-123456789012)")
             return 1
@@ -46,6 +46,11 @@ except ImportError:
 # Import our utility functions
 from api_utils import get_project_summary_by_id, discover_projects, show_usage_tip
 
+# Rules framing the summary and its sections
+BANNER_RULE = "=" * 80
+HEADER_RULE = "-" * 80
+SECTION_RULE = "-" * 40
+
 def format_date(date_str):
     """Format ISO date string to readable format."""
     if not date_str:
@@ -70,29 +75,30 @@ def format_size(size_bytes):
         size_bytes /= 1024.0
     return f"{size_bytes:.1f} PB"
 
-def get_project_summary(project_id):
-    """Get project summary by ID using MindzieAPIClient."""
-    return get_project_summary_by_id(project_id)
+def get_project_summary(project_id, use_cache=True, refresh=False):
+    """Get project summary by ID using MindzieAPIClient (cached on disk)."""
+    return get_project_summary_by_id(project_id, use_cache=use_cache, refresh=refresh)
 
-def display_project_summary(summary_data, project_id):
-    """Display formatted project summary."""
+def display_project_summary(summary_data, project_id, out=None):
+    """Display formatted project summary, written to out (stdout by default) in one call."""
     if not summary_data:
         return
     
-    print("=" * 80)
-    print("PROJECT SUMMARY")
-    print("=" * 80)
+    lines = []
+    lines.append(BANNER_RULE)
+    lines.append("PROJECT SUMMARY")
+    lines.append(BANNER_RULE)
     
     # Project identification
     name = summary_data.get('project_name', 'Unknown Project')
     
-    print(f"\n[INFO] PROJECT: {name}")
-    print(f"ID: {project_id}")
-    print("-" * 80)
+    lines.append(f"\n[INFO] PROJECT: {name}")
+    lines.append(f"ID: {project_id}")
+    lines.append(HEADER_RULE)
     
     # Core Statistics
-    print("\n[INFO] CORE STATISTICS")
-    print("-" * 40)
+    lines.append("\n[INFO] CORE STATISTICS")
+    lines.append(SECTION_RULE)
     
     # Extract from nested statistics
     stats = summary_data.get('statistics', {})
@@ -102,76 +108,76 @@ def display_project_summary(summary_data, project_id):
     notebook_count = stats.get('total_notebooks', 0)
     user_count = stats.get('total_users', 0)
     
-    print(f"Total Datasets:        {dataset_count:>10}")
-    print(f"Total Investigations:  {investigation_count:>10}")
-    print(f"Total Dashboards:      {dashboard_count:>10}")
-    print(f"Total Notebooks:       {notebook_count:>10}")
-    print(f"Active Users:          {user_count:>10}")
+    lines.append(f"Total Datasets:        {dataset_count:>10}")
+    lines.append(f"Total Investigations:  {investigation_count:>10}")
+    lines.append(f"Total Dashboards:      {dashboard_count:>10}")
+    lines.append(f"Total Notebooks:       {notebook_count:>10}")
+    lines.append(f"Active Users:          {user_count:>10}")
     
     # Activity Metrics (if available)
-    print("\n[INFO] ACTIVITY METRICS")
-    print("-" * 40)
+    lines.append("\n[INFO] ACTIVITY METRICS")
+    lines.append(SECTION_RULE)
     
     total_executions = summary_data.get('TotalExecutions') or summary_data.get('total_executions')
     if total_executions is not None:
-        print(f"Total Executions:      {total_executions:>10}")
+        lines.append(f"Total Executions:      {total_executions:>10}")
     
     recent_executions = summary_data.get('RecentExecutions') or summary_data.get('recent_executions')
     if recent_executions is not None:
-        print(f"Recent Executions:     {recent_executions:>10}")
+        lines.append(f"Recent Executions:     {recent_executions:>10}")
     
     avg_execution_time = summary_data.get('AvgExecutionTime') or summary_data.get('avg_execution_time')
     if avg_execution_time is not None:
-        print(f"Avg Execution Time:    {avg_execution_time:>10}s")
+        lines.append(f"Avg Execution Time:    {avg_execution_time:>10}s")
     
     # Storage Information (if available)
-    print("\n[INFO] STORAGE & DATA")
-    print("-" * 40)
+    lines.append("\n[INFO] STORAGE & DATA")
+    lines.append(SECTION_RULE)
     
     total_storage = summary_data.get('TotalStorage') or summary_data.get('total_storage')
     if total_storage is not None:
-        print(f"Total Storage Used:    {format_size(total_storage):>15}")
+        lines.append(f"Total Storage Used:    {format_size(total_storage):>15}")
     
     total_records = summary_data.get('TotalRecords') or summary_data.get('total_records')
     if total_records is not None:
-        print(f"Total Records:         {total_records:>15,}")
+        lines.append(f"Total Records:         {total_records:>15,}")
     
     # Performance Metrics (if available)
-    print("\n[INFO] PERFORMANCE")
-    print("-" * 40)
+    lines.append("\n[INFO] PERFORMANCE")
+    lines.append(SECTION_RULE)
     
     success_rate = summary_data.get('SuccessRate') or summary_data.get('success_rate')
     if success_rate is not None:
-        print(f"Success Rate:          {success_rate:>12.1f}%")
+        lines.append(f"Success Rate:          {success_rate:>12.1f}%")
     
     error_rate = summary_data.get('ErrorRate') or summary_data.get('error_rate')
     if error_rate is not None:
-        print(f"Error Rate:            {error_rate:>12.1f}%")
+        lines.append(f"Error Rate:            {error_rate:>12.1f}%")
     
     # Timestamps
-    print("\n[INFO] TIMELINE")
-    print("-" * 40)
+    lines.append("\n[INFO] TIMELINE")
+    lines.append(SECTION_RULE)
     
     created = summary_data.get('date_created')
     if created:
-        print(f"Created:               {format_date(created)}")
+        lines.append(f"Created:               {format_date(created)}")
     
     last_activity = summary_data.get('date_modified')
     if last_activity:
-        print(f"Last Activity:         {format_date(last_activity)}")
+        lines.append(f"Last Activity:         {format_date(last_activity)}")
     
     # Summary Insights
-    print("\n[INFO] INSIGHTS")
-    print("-" * 40)
+    lines.append("\n[INFO] INSIGHTS")
+    lines.append(SECTION_RULE)
     
     # Calculate some basic insights
     if dataset_count > 0 and dashboard_count > 0:
         ratio = dashboard_count / dataset_count
-        print(f"Dashboard/Dataset Ratio: {ratio:.2f}")
+        lines.append(f"Dashboard/Dataset Ratio: {ratio:.2f}")
     
     if user_count > 0 and dashboard_count > 0:
         dashboards_per_user = dashboard_count / user_count
-        print(f"Dashboards per User:     {dashboards_per_user:.1f}")
+        lines.append(f"Dashboards per User:     {dashboards_per_user:.1f}")
     
     # Project maturity indicator based on content
     if dataset_count >= 10 and dashboard_count >= 20:
@@ -183,9 +189,11 @@ def display_project_summary(summary_data, project_id):
     else:
         maturity = "Starting"
     
-    print(f"Project Maturity:        {maturity}")
+    lines.append(f"Project Maturity:        {maturity}")
+    
+    lines.append("\n" + BANNER_RULE)
     
-    print("\n" + "=" * 80)
+    (out or sys.stdout).write("\n".join(lines) + "\n")
 
 def main():
     """Main function."""
@@ -206,6 +214,12 @@ Examples:
     parser.add_argument('project_id', nargs='?',
                        help='Project ID (GUID format) - auto-selected if not provided')
     
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always fetch from the API instead of the local cache')
+    
+    parser.add_argument('--refresh', action='store_true',
+                       help='Fetch from the API and update the local cache')
+    
     args = parser.parse_args()
     
     if args.project_id:
@@ -235,7 +249,7 @@ Examples:
     print("-" * 60)
     
     # Try to get project summary using mindzie_api library
-    summary_data = get_project_summary(project_id)
+    summary_data = get_project_summary(project_id, not args.no_cache, args.refresh)
     
     if not summary_data:
         print(f"[ERROR] Could not retrieve project summary for {project_id}")
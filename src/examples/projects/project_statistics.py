@@ -17,14 +17,21 @@ Examples:
     
     # Export statistics to CSV file
     python project_statistics.py --export stats.csv
+    
+    # Use per-project summaries for the counts
+    python project_statistics.py --enrich
 """
 
 import os
 import sys
 import csv
 import argparse
+import heapq
+from bisect import bisect_left
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from collections import defaultdict, Counter
 
 # Add parent directory to path for .env loading
@@ -39,6 +46,12 @@ try:
 except ImportError:
     pass
 
+# Optional C ISO 8601 parser; falls back to datetime.fromisoformat()
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = None
+
 # Import the mindzie API library
 from mindzie_api import MindzieAPIClient
 from mindzie_api.exceptions import (
@@ -46,9 +59,46 @@ from mindzie_api.exceptions import (
 )
 
 # Import our utility functions
-from api_utils import get_client, load_credentials
+from api_utils import fetch_cached, get_client, get_project_summaries, load_credentials, project_fields
+
+# Project fields read by calculate_statistics() and enrich_projects()
+STATS_FIELDS = (
+    "project_id", "project_name", "is_active",
+    "dataset_count", "dashboard_count", "investigation_count", "user_count",
+    "date_created", "date_modified"
+)
+
+# Rules framing the report and its sections
+BANNER_RULE = "=" * 80
+SECTION_RULE = "-" * 40
+
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11 on
+FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
 
-def get_all_projects():
+# Distribution buckets: a count goes in the first bucket whose upper bound
+# it does not exceed, or the last bucket past every bound
+DATASET_BUCKET_BOUNDS = (0, 5, 10, 20)
+DATASET_BUCKET_LABELS = ('0', '1-5', '6-10', '11-20', '20+')
+DASHBOARD_BUCKET_BOUNDS = (0, 10, 25, 50)
+DASHBOARD_BUCKET_LABELS = ('0', '1-10', '11-25', '26-50', '50+')
+
+# Project fields filled in from the summary statistics by --enrich
+ENRICH_FIELDS = (
+    ('dataset_count', 'total_datasets'),
+    ('dashboard_count', 'total_dashboards'),
+    ('investigation_count', 'total_investigations'),
+    ('user_count', 'total_users')
+)
+
+def get_all_projects(use_cache=True, refresh=False):
+    """Get all projects, cached on disk for a few minutes between runs.
+    
+    Pass use_cache=False to bypass the cache, or refresh=True to fetch the
+    list again and cache the new result.
+    """
+    return fetch_cached("project_list" if use_cache else None, fetch_all_projects, refresh=refresh)
+
+def fetch_all_projects():
     """Get all projects using the mindzie library."""
     client = get_client()
     if not client:
@@ -56,8 +106,8 @@ def get_all_projects():
     
     try:
         projects = client.projects.list_projects()
-        # Convert to dict format for compatibility with the rest of the script
-        return [project.model_dump() for project in projects]
+        # Copy only the fields the statistics use instead of a full model_dump()
+        return [project_fields(project, STATS_FIELDS) for project in projects]
     except AuthenticationError:
         print("[ERROR] Authentication failed - check your credentials")
         return None
@@ -70,20 +120,62 @@ def get_all_projects():
     finally:
         client.close()
 
+def enrich_projects(projects, use_cache=True, refresh=False):
+    """Fill in project counts from the per-project summaries.
+    
+    The summaries are fetched concurrently; projects without a summary keep
+    the counts from the project list. Returns the number of projects enriched.
+    """
+    project_ids = [project['project_id'] for project in projects if project.get('project_id')]
+    summaries = get_project_summaries(project_ids, use_cache=use_cache, refresh=refresh)
+    
+    for project in projects:
+        summary = summaries.get(project.get('project_id')) or {}
+        statistics = summary.get('statistics') or {}
+        for field, statistic in ENRICH_FIELDS:
+            if statistics.get(statistic) is not None:
+                project[field] = statistics[statistic]
+    return len(summaries)
+
+@lru_cache(maxsize=1024)
 def parse_date(date_str):
-    """Parse date string into datetime object."""
+    """Parse date string (or datetime) into a UTC-aware datetime object."""
     if not date_str:
         return None
-    try:
-        if 'T' in date_str:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        else:
-            return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-    except:
-        return None
+    if isinstance(date_str, datetime):
+        dt = date_str
+    else:
+        try:
+            if parse_datetime:
+                dt = parse_datetime(date_str)
+            else:
+                if date_str.endswith('Z') and not FROMISOFORMAT_ACCEPTS_Z:
+                    date_str = date_str[:-1] + '+00:00'
+                # Also accepts the "YYYY-MM-DD HH:MM:SS" form
+                dt = datetime.fromisoformat(date_str)
+        except (ValueError, TypeError):
+            return None
+    # Dates without an offset are UTC; mixing naive and aware dates cannot be sorted
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+def project_info(project, created_date=None):
+    """Build the per-project record used in the top and recent project lists."""
+    is_active = project.get('is_active', True)
+    return {
+        'name': project.get('project_name', 'Unnamed Project'),
+        'is_active': is_active,
+        'dataset_count': project.get('dataset_count', 0),
+        'dashboard_count': project.get('dashboard_count', 0),
+        'notebook_count': project.get('investigation_count', 0),  # Map investigation to notebook for stats
+        'user_count': project.get('user_count', 0),
+        'project_type': 'Standard',  # Default since this field isn't in the current API
+        'status': 'Active' if is_active else 'Inactive',
+        'created_date': created_date if created_date is not None else parse_date(project.get('date_created')),
+        'updated_date': parse_date(project.get('date_modified'))
+    }
 
 def calculate_statistics(projects):
-    """Calculate comprehensive statistics from projects."""
+    """Calculate comprehensive statistics from projects in a single pass."""
     if not projects:
         return {}
     
@@ -115,39 +207,20 @@ def calculate_statistics(projects):
         'oldest_projects': []
     }
     
-    project_data = []
+    # (creation date, project) for the recent/oldest lists
+    dated_projects = []
     
     for project in projects:
-        # Extract project data using the corrected field names
-        name = project.get('project_name', 'Unnamed Project')
-        
+        # Accumulate straight from the project using the corrected field names
         is_active = project.get('is_active', True)
         dataset_count = project.get('dataset_count', 0)
         dashboard_count = project.get('dashboard_count', 0)
         notebook_count = project.get('investigation_count', 0)  # Map investigation to notebook for stats
         user_count = project.get('user_count', 0)
         
-        project_type = 'Standard'  # Default since this field isn't in the current API
-        status = 'Active' if is_active else 'Inactive'
-        
         created_date = parse_date(project.get('date_created'))
         updated_date = parse_date(project.get('date_modified'))
         
-        # Store project data for detailed analysis
-        project_info = {
-            'name': name,
-            'is_active': is_active,
-            'dataset_count': dataset_count,
-            'dashboard_count': dashboard_count,
-            'notebook_count': notebook_count,
-            'user_count': user_count,
-            'project_type': project_type,
-            'status': status,
-            'created_date': created_date,
-            'updated_date': updated_date
-        }
-        project_data.append(project_info)
-        
         # Update statistics
         if is_active:
             stats['active_projects'] += 1
@@ -168,36 +241,18 @@ def calculate_statistics(projects):
         stats['max_dashboards'] = max(stats['max_dashboards'], dashboard_count)
         stats['max_notebooks'] = max(stats['max_notebooks'], notebook_count)
         
-        stats['project_types'][project_type] += 1
-        stats['status_distribution'][status] += 1
+        stats['project_types']['Standard'] += 1
+        stats['status_distribution']['Active' if is_active else 'Inactive'] += 1
         
         if created_date:
             stats['creation_dates'].append(created_date)
+            dated_projects.append((created_date, project))
         if updated_date:
             stats['update_dates'].append(updated_date)
         
         # Distribution buckets
-        if dataset_count == 0:
-            stats['dataset_distribution']['0'] += 1
-        elif dataset_count <= 5:
-            stats['dataset_distribution']['1-5'] += 1
-        elif dataset_count <= 10:
-            stats['dataset_distribution']['6-10'] += 1
-        elif dataset_count <= 20:
-            stats['dataset_distribution']['11-20'] += 1
-        else:
-            stats['dataset_distribution']['20+'] += 1
-        
-        if dashboard_count == 0:
-            stats['dashboard_distribution']['0'] += 1
-        elif dashboard_count <= 10:
-            stats['dashboard_distribution']['1-10'] += 1
-        elif dashboard_count <= 25:
-            stats['dashboard_distribution']['11-25'] += 1
-        elif dashboard_count <= 50:
-            stats['dashboard_distribution']['26-50'] += 1
-        else:
-            stats['dashboard_distribution']['50+'] += 1
+        stats['dataset_distribution'][DATASET_BUCKET_LABELS[bisect_left(DATASET_BUCKET_BOUNDS, dataset_count)]] += 1
+        stats['dashboard_distribution'][DASHBOARD_BUCKET_LABELS[bisect_left(DASHBOARD_BUCKET_BOUNDS, dashboard_count)]] += 1
     
     # Calculate averages
     if stats['total_projects'] > 0:
@@ -205,128 +260,134 @@ def calculate_statistics(projects):
         stats['avg_dashboards_per_project'] = stats['total_dashboards'] / stats['total_projects']
         stats['avg_notebooks_per_project'] = stats['total_notebooks'] / stats['total_projects']
     
-    # Top projects
-    project_data_sorted_datasets = sorted(project_data, key=lambda x: x['dataset_count'], reverse=True)
-    stats['top_projects_by_datasets'] = project_data_sorted_datasets[:10]
-    
-    project_data_sorted_dashboards = sorted(project_data, key=lambda x: x['dashboard_count'], reverse=True)
-    stats['top_projects_by_dashboards'] = project_data_sorted_dashboards[:10]
+    # Top projects; nlargest() keeps ties in input order like a stable sort
+    stats['top_projects_by_datasets'] = [
+        project_info(project)
+        for project in heapq.nlargest(10, projects, key=lambda p: p.get('dataset_count', 0))
+    ]
+    stats['top_projects_by_dashboards'] = [
+        project_info(project)
+        for project in heapq.nlargest(10, projects, key=lambda p: p.get('dashboard_count', 0))
+    ]
     
     # Recent and oldest projects
-    if stats['creation_dates']:
-        project_data_with_dates = [p for p in project_data if p['created_date']]
-        if project_data_with_dates:
-            recent_sorted = sorted(project_data_with_dates, key=lambda x: x['created_date'], reverse=True)
-            stats['recent_projects'] = recent_sorted[:5]
-            
-            oldest_sorted = sorted(project_data_with_dates, key=lambda x: x['created_date'])
-            stats['oldest_projects'] = oldest_sorted[:5]
+    stats['recent_projects'] = [
+        project_info(project, created_date)
+        for created_date, project in heapq.nlargest(5, dated_projects, key=itemgetter(0))
+    ]
+    stats['oldest_projects'] = [
+        project_info(project, created_date)
+        for created_date, project in heapq.nsmallest(5, dated_projects, key=itemgetter(0))
+    ]
     
     return stats
 
-def display_statistics(stats, detailed=False):
-    """Display formatted statistics."""
-    print("=" * 80)
-    print("mindzie TENANT PROJECT STATISTICS")
-    print("=" * 80)
+def display_statistics(stats, detailed=False, out=None):
+    """Display formatted statistics, written to out (stdout by default) in one call."""
+    lines = []
+    lines.append(BANNER_RULE)
+    lines.append("mindzie TENANT PROJECT STATISTICS")
+    lines.append(BANNER_RULE)
     
     # Overview
-    print(f"\n[OVERVIEW]")
-    print("-" * 40)
-    print(f"Total Projects:           {stats['total_projects']:>10}")
-    print(f"Active Projects:          {stats['active_projects']:>10}")
-    print(f"Inactive Projects:        {stats['inactive_projects']:>10}")
+    lines.append(f"\n[OVERVIEW]")
+    lines.append(SECTION_RULE)
+    lines.append(f"Total Projects:           {stats['total_projects']:>10}")
+    lines.append(f"Active Projects:          {stats['active_projects']:>10}")
+    lines.append(f"Inactive Projects:        {stats['inactive_projects']:>10}")
     
     if stats['total_projects'] > 0:
         active_pct = (stats['active_projects'] / stats['total_projects']) * 100
-        print(f"Active Rate:              {active_pct:>9.1f}%")
+        lines.append(f"Active Rate:              {active_pct:>9.1f}%")
     
     # Content Statistics
-    print(f"\n[CONTENT STATISTICS]")
-    print("-" * 40)
-    print(f"Total Datasets:           {stats['total_datasets']:>10}")
-    print(f"Total Dashboards:         {stats['total_dashboards']:>10}")
-    print(f"Total Investigations:     {stats['total_notebooks']:>10}")
-    print(f"Total Users:              {stats['total_users']:>10}")
+    lines.append(f"\n[CONTENT STATISTICS]")
+    lines.append(SECTION_RULE)
+    lines.append(f"Total Datasets:           {stats['total_datasets']:>10}")
+    lines.append(f"Total Dashboards:         {stats['total_dashboards']:>10}")
+    lines.append(f"Total Investigations:     {stats['total_notebooks']:>10}")
+    lines.append(f"Total Users:              {stats['total_users']:>10}")
     
-    print(f"\nAvg Datasets/Project:     {stats['avg_datasets_per_project']:>10.1f}")
-    print(f"Avg Dashboards/Project:   {stats['avg_dashboards_per_project']:>10.1f}")
-    print(f"Avg Investigations/Project: {stats['avg_notebooks_per_project']:>8.1f}")
+    lines.append(f"\nAvg Datasets/Project:     {stats['avg_datasets_per_project']:>10.1f}")
+    lines.append(f"Avg Dashboards/Project:   {stats['avg_dashboards_per_project']:>10.1f}")
+    lines.append(f"Avg Investigations/Project: {stats['avg_notebooks_per_project']:>8.1f}")
     
-    print(f"\nMax Datasets (1 project): {stats['max_datasets']:>10}")
-    print(f"Max Dashboards (1 project): {stats['max_dashboards']:>8}")
-    print(f"Max Investigations (1 project): {stats['max_notebooks']:>5}")
+    lines.append(f"\nMax Datasets (1 project): {stats['max_datasets']:>10}")
+    lines.append(f"Max Dashboards (1 project): {stats['max_dashboards']:>8}")
+    lines.append(f"Max Investigations (1 project): {stats['max_notebooks']:>5}")
     
     # Project Health
-    print(f"\n[PROJECT HEALTH]")
-    print("-" * 40)
-    print(f"Projects with Data:       {stats['projects_with_data']:>10}")
-    print(f"Empty Projects:           {stats['empty_projects']:>10}")
+    lines.append(f"\n[PROJECT HEALTH]")
+    lines.append(SECTION_RULE)
+    lines.append(f"Projects with Data:       {stats['projects_with_data']:>10}")
+    lines.append(f"Empty Projects:           {stats['empty_projects']:>10}")
     
     if stats['total_projects'] > 0:
         healthy_pct = (stats['projects_with_data'] / stats['total_projects']) * 100
-        print(f"Health Rate:              {healthy_pct:>9.1f}%")
+        lines.append(f"Health Rate:              {healthy_pct:>9.1f}%")
     
     if detailed:
         # Distribution Analysis
-        print(f"\n[DATASET DISTRIBUTION]")
-        print("-" * 40)
+        lines.append(f"\n[DATASET DISTRIBUTION]")
+        lines.append(SECTION_RULE)
         for bucket, count in sorted(stats['dataset_distribution'].items()):
             pct = (count / stats['total_projects']) * 100 if stats['total_projects'] > 0 else 0
-            print(f"{bucket:>15} datasets: {count:>3} projects ({pct:4.1f}%)")
+            lines.append(f"{bucket:>15} datasets: {count:>3} projects ({pct:4.1f}%)")
         
-        print(f"\n[DASHBOARD DISTRIBUTION]")
-        print("-" * 40)
+        lines.append(f"\n[DASHBOARD DISTRIBUTION]")
+        lines.append(SECTION_RULE)
         for bucket, count in sorted(stats['dashboard_distribution'].items()):
             pct = (count / stats['total_projects']) * 100 if stats['total_projects'] > 0 else 0
-            print(f"{bucket:>15} dashboards: {count:>3} projects ({pct:4.1f}%)")
+            lines.append(f"{bucket:>15} dashboards: {count:>3} projects ({pct:4.1f}%)")
         
         # Top Projects
-        print(f"\n[TOP PROJECTS BY DATASETS]")
-        print("-" * 40)
+        lines.append(f"\n[TOP PROJECTS BY DATASETS]")
+        lines.append(SECTION_RULE)
         for i, project in enumerate(stats['top_projects_by_datasets'][:5], 1):
             if project['dataset_count'] > 0:
-                print(f"{i:>2}. {project['name'][:50]:50} ({project['dataset_count']:>2} datasets)")
+                lines.append(f"{i:>2}. {project['name'][:50]:50} ({project['dataset_count']:>2} datasets)")
         
-        print(f"\n[TOP PROJECTS BY DASHBOARDS]")
-        print("-" * 40)
+        lines.append(f"\n[TOP PROJECTS BY DASHBOARDS]")
+        lines.append(SECTION_RULE)
         for i, project in enumerate(stats['top_projects_by_dashboards'][:5], 1):
             if project['dashboard_count'] > 0:
-                print(f"{i:>2}. {project['name'][:50]:50} ({project['dashboard_count']:>2} dashboards)")
+                lines.append(f"{i:>2}. {project['name'][:50]:50} ({project['dashboard_count']:>2} dashboards)")
         
         # Project Types
         if len(stats['project_types']) > 1:
-            print(f"\n[PROJECT TYPES]")
-            print("-" * 40)
+            lines.append(f"\n[PROJECT TYPES]")
+            lines.append(SECTION_RULE)
             for ptype, count in stats['project_types'].most_common():
                 pct = (count / stats['total_projects']) * 100 if stats['total_projects'] > 0 else 0
-                print(f"{ptype:>20}: {count:>3} projects ({pct:4.1f}%)")
+                lines.append(f"{ptype:>20}: {count:>3} projects ({pct:4.1f}%)")
         
         # Recent Activity
         if stats['recent_projects']:
-            print(f"\n[RECENTLY CREATED PROJECTS]")
-            print("-" * 40)
+            lines.append(f"\n[RECENTLY CREATED PROJECTS]")
+            lines.append(SECTION_RULE)
             for project in stats['recent_projects']:
                 date_str = project['created_date'].strftime("%Y-%m-%d") if project['created_date'] else "Unknown"
-                print(f"{date_str}: {project['name'][:55]}")
+                lines.append(f"{date_str}: {project['name'][:55]}")
     
     # Timeline Analysis
     if stats['creation_dates']:
         earliest = min(stats['creation_dates'])
         latest = max(stats['creation_dates'])
         
-        print(f"\n[TIMELINE]")
-        print("-" * 40)
-        print(f"Earliest Project:         {earliest.strftime('%Y-%m-%d %H:%M UTC')}")
-        print(f"Latest Project:           {latest.strftime('%Y-%m-%d %H:%M UTC')}")
+        lines.append(f"\n[TIMELINE]")
+        lines.append(SECTION_RULE)
+        lines.append(f"Earliest Project:         {earliest.strftime('%Y-%m-%d %H:%M UTC')}")
+        lines.append(f"Latest Project:           {latest.strftime('%Y-%m-%d %H:%M UTC')}")
         
         # Calculate project creation rate
         days_span = (latest - earliest).days
         if days_span > 0:
             rate = len(stats['creation_dates']) / days_span
-            print(f"Creation Rate:            {rate:.2f} projects/day")
+            lines.append(f"Creation Rate:            {rate:.2f} projects/day")
     
-    print("\n" + "=" * 80)
+    lines.append("\n" + BANNER_RULE)
+    
+    (out or sys.stdout).write("\n".join(lines) + "\n")
 
 def export_to_csv(stats, filename):
     """Export statistics to CSV file."""
@@ -384,6 +445,9 @@ Examples:
     
     # Both detailed view and CSV export
     python project_statistics.py --detailed --export full_stats.csv
+    
+    # Use per-project summaries for the counts
+    python project_statistics.py --enrich
         """
     )
     
@@ -393,15 +457,30 @@ Examples:
     parser.add_argument('--export', metavar='FILE',
                        help='Export statistics to CSV file')
     
+    parser.add_argument('--enrich', action='store_true',
+                       help='Fetch each project summary for more accurate counts')
+    
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always fetch from the API instead of the local cache')
+    
+    parser.add_argument('--refresh', action='store_true',
+                       help='Fetch from the API and update the local cache')
+    
     args = parser.parse_args()
     
     print("Fetching all projects...")
-    projects = get_all_projects()
+    use_cache = not args.no_cache
+    projects = get_all_projects(use_cache, args.refresh)
     
     if not projects:
         print("[ERROR] Failed to retrieve projects")
         return 1
     
+    if args.enrich:
+        print("Fetching project summaries...")
+        enriched = enrich_projects(projects, use_cache, args.refresh)
+        print(f"Enriched {enriched} of {len(projects)} projects")
+    
     print(f"Analyzing {len(projects)} projects...")
     stats = calculate_statistics(projects)
     